@@ -1,4 +1,6 @@
 # analyzer.py - analysis logic for the CLI Data Analyzer 
+import sys
+
 def analyze_numbers(numbers):
     # This function takes a list of numbers and returns basic statistics.
     if not numbers:
@@ -7,8 +9,16 @@ def analyze_numbers(numbers):
     total = sum(numbers)
     count = len(numbers)
     average = total / count
-    minimum = min(numbers)
-    maximum = max(numbers)
+
+    # Track min and max together so the list is only walked once for both.
+    # sum() stays separate because its C float loop is much faster than
+    # accumulating in Python.
+    minimum = maximum = numbers[0]
+    for num in numbers:
+        if num < minimum:
+            minimum = num
+        elif num > maximum:
+            maximum = num
 
     return {
         "total": total,
@@ -22,9 +32,7 @@ def print_report(numbers, results):
     print("\nAnalysis Report")
     print("----------------")
     print("Numbers Entered:")
-    for num in numbers:
-        print(num, end=" ")
-    print()
+    sys.stdout.write(" ".join(map(str, numbers)) + "\n")
     print("\nStatistics:")
     print(f"Total: {results.get('total')}")
     print(f"Count: {results.get('count')}")
@@ -1,5 +1,22 @@
+import sys
+
 from storage import save_numbers, load_numbers, save_report
-from analyzer import analyze_numbers
+from analyzer import analyze_numbers, print_report
+
+
+def read_piped_numbers(count):
+    # When input is piped in, read the values straight from stdin instead of
+    # going through a prompted input() call for every number.
+    numbers = []
+    for line in iter(sys.stdin.readline, ""):
+        try:
+            numbers.append(float(line))
+        except ValueError:
+            print("Invalid input. Please enter a valid number.")
+            continue
+        if len(numbers) == count:
+            break
+    return numbers
 
 
 def collect_numbers():
@@ -16,7 +33,10 @@ def collect_numbers():
             print("Invalid input. Please enter a whole number.")
 
 
-    for i in range(count):
+    if not sys.stdin.isatty():
+        numbers = read_piped_numbers(count)
+
+    for i in range(len(numbers), count):
         while True:
             try:
                 num = float(input(f"Enter number {i + 1}: "))
@@ -26,9 +46,7 @@ def collect_numbers():
                 print("Invalid input. Please enter a valid number.")
 
     print("You entered the following numbers:")
-    for num in numbers:
-        print(num, end=" ")
-        print()
+    sys.stdout.write(" ".join(map(str, numbers)) + "\n")
     
     
 
@@ -8,7 +8,9 @@ from datetime import datetime
 import json
 def save_numbers(numbers, filename="data.json"):
     with open(filename, "w") as f:
-        json.dump({"numbers": numbers}, f, indent=2)
+        # Encode to one string and write it once; json.dump would call
+        # f.write() for every encoded chunk (several per number).
+        f.write(json.dumps({"numbers": numbers}, indent=2))
 
 #create a function load_numbers(filename="data.json")
 #it should load the list of numbers from a JSON file and return the list under the "numbers key
@@ -16,23 +18,28 @@ def save_numbers(numbers, filename="data.json"):
 #do not print anything in this function
 def load_numbers(filename="data.json"):
     try:
-        with open(filename, "r") as f:
-            data = json.load(f)
+        # Read the raw bytes and let json.loads decode them in one call
+        # instead of going through the text-mode reader.
+        with open(filename, "rb") as f:
+            data = json.loads(f.read())
             return data.get("numbers", [])
-    except (FileNotFoundError, json.JSONDecodeError):
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
         return []
     
 def save_report(numbers, results):
-    with open("report.txt", "w") as f:
-        f.write(f"Analysis Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("Numbers Entered:\n")
-        for num in numbers:
-            f.write(f"{num}\n")
-        f.write("\nStatistics:\n")
-        f.write(f"Total: {results.get('total')}\n")
-        f.write(f"Count: {results.get('count')}\n")
-        f.write(f"Average: {results.get('average'):.2f}\n")
-        f.write(f"Minimum: {results.get('min')}\n")
-        f.write(f"Maximum: {results.get('max')}\n")
+    # Build the whole report first so it is encoded and written in one go.
+    lines = [f"Analysis Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", "Numbers Entered:"]
+    lines.extend(f"{num}" for num in numbers)
+    lines.extend([
+        "",
+        "Statistics:",
+        f"Total: {results.get('total')}",
+        f"Count: {results.get('count')}",
+        f"Average: {results.get('average'):.2f}",
+        f"Minimum: {results.get('min')}",
+        f"Maximum: {results.get('max')}",
+    ])
+    with open("report.txt", "wb") as f:
+        f.write(("\n".join(lines) + "\n").encode("utf-8"))
     print("\nAnalysis report saved to report.txt")
     
\ No newline at end of file
@@ -0,0 +1,82 @@
+import math
+import unittest
+
+from weather_analysis import WeatherAnalysisError, analyze_time_series, calculate_standard_deviation
+
+
+class AnalyzeTimeSeriesOverflowTests(unittest.TestCase):
+    def test_huge_values_do_not_crash(self):
+        result = analyze_time_series(["a", "b"], [1e308, 1e308])
+        self.assertEqual(result["average"], math.inf)
+        self.assertEqual(result["min"], 1e308)
+        self.assertEqual(result["max"], 1e308)
+        self.assertEqual(result["stddev"], 0.0)
+
+    def test_opposite_infinities_do_not_crash(self):
+        result = analyze_time_series(["a", "b"], ["inf", "-inf"])
+        self.assertTrue(math.isnan(result["average"]))
+        self.assertTrue(math.isnan(result["stddev"]))
+
+    def test_stddev_without_mean_handles_overflow(self):
+        self.assertAlmostEqual(calculate_standard_deviation([1e308, 1e308, -1e308]) / 1.1547005383792515e308, 1.0)
+
+    def test_stddev_of_huge_deviations_is_finite(self):
+        self.assertAlmostEqual(calculate_standard_deviation([1e200, -1e200]) / 1.4142135623730951e200, 1.0)
+        self.assertAlmostEqual(calculate_standard_deviation([1e155, 0.0]) / 7.0710678118654755e154, 1.0)
+
+
+
+class AnalyzeTimeSeriesValidationTests(unittest.TestCase):
+    def test_clean_series(self):
+        result = analyze_time_series(["t0", "t1", "t2"], [3, "1.5", 2])
+        self.assertEqual(result["count"], 3)
+        self.assertEqual(result["warnings"], [])
+        self.assertFalse(result["truncated"])
+        self.assertEqual((result["min"], result["min_time"]), (1.5, "t1"))
+        self.assertEqual((result["max"], result["max_time"]), (3.0, "t0"))
+
+    def test_none_time_is_skipped(self):
+        result = analyze_time_series([None, "t1", "t2"], [1, 2, 3])
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(result["warnings"], ["Skipped 1 pair(s) where time or temperature was missing."])
+        self.assertEqual((result["min"], result["min_time"]), (2.0, "t1"))
+
+    def test_none_temperature_is_skipped(self):
+        result = analyze_time_series(["t0", "t1", "t2"], [1, None, 3])
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(result["warnings"], ["Skipped 1 pair(s) where time or temperature was missing."])
+        self.assertEqual((result["max"], result["max_time"]), (3.0, "t2"))
+
+    def test_non_numeric_temperature_with_none_time_is_skipped(self):
+        result = analyze_time_series([None, "t1"], ["x", 2])
+        self.assertEqual(result["count"], 1)
+        self.assertEqual(result["min_time"], "t1")
+
+    def test_non_numeric_temperature_reports_index(self):
+        with self.assertRaisesRegex(WeatherAnalysisError, "at index 1: x"):
+            analyze_time_series(["t0", "t1"], [1, "x"])
+        with self.assertRaisesRegex(WeatherAnalysisError, "at index 2: x"):
+            analyze_time_series(["t0", None, "t2"], [1, 2, "x"])
+
+    def test_mismatched_lengths_are_truncated(self):
+        result = analyze_time_series(["t0", "t1", "t2"], [1, 2])
+        self.assertTrue(result["truncated"])
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(
+            result["warnings"],
+            ["Input lengths differ: times=3, temperatures=2; truncated to shorter length."],
+        )
+
+    def test_tied_extremes_use_first_occurrence(self):
+        result = analyze_time_series(["t0", "t1", "t2", "t3"], [5, 1, 5, 1])
+        self.assertEqual((result["min_time"], result["max_time"]), ("t1", "t0"))
+        result = analyze_time_series(["t0", None, "t2", "t3", "t4"], [5, 9, 1, 5, 1])
+        self.assertEqual((result["min_time"], result["max_time"]), ("t2", "t0"))
+
+    def test_no_valid_pairs(self):
+        with self.assertRaises(WeatherAnalysisError):
+            analyze_time_series(["t0", None], [None, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
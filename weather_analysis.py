@@ -14,28 +14,52 @@ Behavior notes:
 - Non-numeric temperature values raise WeatherAnalysisError.
 """
 
+import math
 import statistics
-from typing import Sequence, Any
+from typing import Any, Dict, List, Optional, Sequence
 
 
 class WeatherAnalysisError(Exception):
     """Controlled exception raised for invalid or missing inputs."""
 
 
-def calculate_median(temperatures):
+def _accurate_sum(values: Sequence[float]) -> float:
+    # math.fsum is correctly rounded, but raises OverflowError when a partial
+    # sum of finite values overflows and ValueError on inf + -inf; sum() then
+    # gives the plain float result (inf/nan) instead of crashing.
+    try:
+        return math.fsum(values)
+    except (OverflowError, ValueError):
+        return sum(values)
+
+
+def calculate_median(temperatures: Sequence[float]) -> Optional[float]:
     if not temperatures:
         return None
     return statistics.median(temperatures)
 
 
-def calculate_standard_deviation(temperatures):
-    # statistics.stdev requires at least two data points
+def calculate_standard_deviation(temperatures: Sequence[float], mean: Optional[float] = None) -> Optional[float]:
+    # A sample standard deviation requires at least two data points
     if not temperatures or len(temperatures) < 2:
         return None
-    return statistics.stdev(temperatures)
-
-
-def analyze_time_series(times: Sequence[Any], temperatures: Sequence[Any]):
+    # Two-pass sample standard deviation: the mean (reused from the caller
+    # when given) and then one accurate sum over the squared deviations.
+    # statistics.stdev gives the same result via exact fractions, which is
+    # far slower per element.
+    if mean is None:
+        mean = _accurate_sum(temperatures) / len(temperatures)
+    squared_deviations = [(x - mean) * (x - mean) for x in temperatures]
+    stddev = math.sqrt(_accurate_sum(squared_deviations) / (len(temperatures) - 1))
+    # Squaring a deviation above ~1.3e154 (or a mean that overflowed) gives
+    # inf/nan for finite input; statistics.stdev's exact arithmetic handles
+    # those extreme ranges correctly.
+    if not math.isfinite(stddev) and all(map(math.isfinite, temperatures)):
+        return statistics.stdev(temperatures)
+    return stddev
+
+
+def analyze_time_series(times: Sequence[Any], temperatures: Sequence[Any]) -> Dict[str, Any]:
     """Analyze paired `times` and `temperatures` sequences.
 
     Args:
@@ -44,7 +68,7 @@ def analyze_time_series(times: Sequence[Any], temperatures: Sequence[Any]):
 
     Returns:
         dict with keys: median, stddev, min, min_time, max, max_time, average,
-        truncated (bool), warnings (list).
+        truncated (bool), warnings (list), count.
 
     Raises:
         WeatherAnalysisError: for missing/empty inputs or if no valid pairs exist.
@@ -66,7 +90,7 @@ def analyze_time_series(times: Sequence[Any], temperatures: Sequence[Any]):
     except TypeError:
         raise WeatherAnalysisError("'times' and 'temperatures' must be sequences (e.g., lists).")
 
-    warnings = []
+    warnings: List[str] = []
     truncated = False
     if len_times == 0 or len_temps == 0:
         raise WeatherAnalysisError("'times' and 'temperatures' must not be empty.")
@@ -78,23 +102,41 @@ def analyze_time_series(times: Sequence[Any], temperatures: Sequence[Any]):
 
     effective_length = min(len_times, len_temps)
 
-    # Build validated pairs: skip pairs where either value is None.
-    valid_times = []
-    valid_temps = []
-    skipped_pairs = 0
-    for i in range(effective_length):
-        t = times[i]
-        temp = temperatures[i]
-        if t is None or temp is None:
-            skipped_pairs += 1
-            continue
-        # Ensure temperature is numeric / convertible to float
+    if truncated:
+        times = times[:effective_length]
+        temperatures = temperatures[:effective_length]
+
+    # Fast path for the common, fully clean series: convert every temperature
+    # in one C-level map() call. A None or non-numeric temperature makes
+    # float() raise, in which case we fall back to the per-pair loop below,
+    # which skips missing pairs and reports the offending index.
+    valid_temps: Optional[List[float]] = None
+    valid_times: Sequence[Any] = times
+    if None not in times:
         try:
-            ftemp = float(temp)
+            valid_temps = list(map(float, temperatures))
         except (TypeError, ValueError):
-            raise WeatherAnalysisError(f"Invalid temperature value at index {i}: {temp}")
-        valid_times.append(t)
-        valid_temps.append(ftemp)
+            pass
+
+    # Build validated pairs: skip pairs where either value is None.
+    skipped_pairs = 0
+    if valid_temps is None:
+        kept_times: List[Any] = []
+        valid_temps = []
+        # times/temperatures were already cut to effective_length above, so
+        # zip() walks them pairwise without a subscript call per element.
+        for i, (t, temp) in enumerate(zip(times, temperatures)):
+            if t is None or temp is None:
+                skipped_pairs += 1
+                continue
+            # Ensure temperature is numeric / convertible to float
+            try:
+                ftemp = float(temp)
+            except (TypeError, ValueError):
+                raise WeatherAnalysisError(f"Invalid temperature value at index {i}: {temp}")
+            kept_times.append(t)
+            valid_temps.append(ftemp)
+        valid_times = kept_times
 
     if skipped_pairs:
         warnings.append(f"Skipped {skipped_pairs} pair(s) where time or temperature was missing.")
@@ -102,19 +144,23 @@ def analyze_time_series(times: Sequence[Any], temperatures: Sequence[Any]):
     if not valid_temps:
         raise WeatherAnalysisError("No valid time/temperature pairs available after validation.")
 
-    median_temp = calculate_median(valid_temps)
-    stddev_temp = calculate_standard_deviation(valid_temps)
-
-    # Safe min/max and corresponding time lookups
-    min_temp = min(valid_temps)
-    max_temp = max(valid_temps)
-    # Use the first occurrence of the min/max
-    min_index = valid_temps.index(min_temp)
-    max_index = valid_temps.index(max_temp)
+    count = len(valid_temps)
+    average = _accurate_sum(valid_temps) / count
+
+    # Safe min/max and corresponding time lookups, found in one pass.
+    # Strict comparisons keep the first occurrence of the min/max.
+    min_temp = max_temp = valid_temps[0]
+    min_index = max_index = 0
+    for i, temp in enumerate(valid_temps):
+        if temp < min_temp:
+            min_temp, min_index = temp, i
+        elif temp > max_temp:
+            max_temp, max_index = temp, i
     min_temp_time = valid_times[min_index]
     max_temp_time = valid_times[max_index]
 
-    average = sum(valid_temps) / len(valid_temps)
+    median_temp = calculate_median(valid_temps)
+    stddev_temp = calculate_standard_deviation(valid_temps, average)
 
     result = {
         "median": median_temp,
@@ -127,7 +173,7 @@ def analyze_time_series(times: Sequence[Any], temperatures: Sequence[Any]):
         "truncated": truncated,
         "warnings": warnings,
         # include a small summary of counts for debugging/visibility
-        "count": len(valid_temps),
+        "count": count,
     }
 
     return result